@@ -2,7 +2,7 @@ import numpy as np
 import random
 
 class MOWWO:
-    def __init__(self, population_size, max_iterations, objectives, problem, constraints, KN=5, hmax=10):
+    def __init__(self, population_size, max_iterations, objectives, problem, constraints, KN=5, hmax=10, initial_solutions=None):
         self.population_size = population_size
         self.max_iterations = max_iterations
         self.objectives = objectives
@@ -10,16 +10,53 @@ class MOWWO:
         self.constraints = constraints
         self.KN = KN
         self.hmax = hmax
+        self.initial_solutions = initial_solutions or []
         self.population = self.initialize_population()
         self.stagnation = [0] * self.population_size
 
     def initialize_population(self):
         pop = []
-        for _ in range(self.population_size):
-            sol = self.random_solution()
+        # Warm start: seed with previous solutions adapted to the current instance
+        seeds = [self.adapt_solution(sol) for sol in self.initial_solutions]
+        for sol in seeds[:self.population_size]:
+            pop.append(sol)
+        # Fill the rest with perturbed seeds (or random solutions on a cold start)
+        while len(pop) < self.population_size:
+            if seeds:
+                sol = self.repair(self.cap_transfers(self.mutate_wave(random.choice(seeds), 0.5)))
+            else:
+                sol = self.random_solution()
             pop.append(sol)
         return pop
 
+    def solution_shapes(self):
+        m, n, K1 = self.problem.m, self.problem.n, self.problem.K1
+        return {'xijk': (m, n, K1), 'xjjk': (n, n, K1), 'yo': (m, n), 'ys': (m, n), 'ym': (m, n), 'yv': (m, n)}
+
+    def adapt_solution(self, sol):
+        # Fit a solution from a previous run to the current instance: resize arrays
+        # to the current dimensions (new entries start at 0), drop negative values
+        # and cap patient transfers at the current case counts
+        new_sol = {}
+        for key, shape in self.solution_shapes().items():
+            arr = np.zeros(shape, dtype=int)
+            old = np.asarray(sol.get(key, arr), dtype=int)
+            if old.ndim == arr.ndim:
+                overlap = tuple(slice(0, min(a, b)) for a, b in zip(shape, old.shape))
+                arr[overlap] = old[overlap]
+            new_sol[key] = np.maximum(arr, 0)
+        return self.repair(self.cap_transfers(new_sol))
+
+    def cap_transfers(self, sol):
+        # Patients transferred out of each civilian service cannot exceed its case counts
+        caps = {'yo': self.problem.no_i, 'ys': self.problem.ns_i, 'ym': self.problem.nm_i, 'yv': self.problem.nv_i}
+        for key, cap in caps.items():
+            y = sol[key]
+            for i in range(self.problem.m):
+                while y[i].sum() > cap[i]:
+                    y[i][np.argmax(y[i])] -= 1
+        return sol
+
     def random_solution(self):
         # Section 4.1: Random but feasible-like solution
         m, n, K, K1 = self.problem.m, self.problem.n, self.problem.K, self.problem.K1
@@ -110,7 +147,7 @@ class MOWWO:
             neighbors.append(self.repair(neighbor))
         return neighbors
 
-    def run(self):
+    def run(self, progress_callback=None):
         population = self.population
         stagnation = [0] * self.population_size
         best_front = []
@@ -144,13 +181,17 @@ class MOWWO:
                     neighbors = self.local_search(evaluated[idx]['solution'])
                     for neighbor in neighbors:
                         new_population.append(neighbor)
-            # Stagnation: reinitialize if needed
+            # Stagnation: reinitialize if needed. On a warm start, members of the
+            # current front are kept so the previous plan is never thrown away
+            protected = set(nd_indices) if self.initial_solutions else set()
             for i in range(self.population_size):
-                if stagnation[i] > self.hmax:
+                if stagnation[i] > self.hmax and i not in protected:
                     new_population[i] = self.random_solution()
                     stagnation[i] = 0
             # Truncate to population size
             population = new_population[:self.population_size]
+            if progress_callback is not None:
+                progress_callback(iteration + 1, self.max_iterations)
         # Final non-dominated sorting
         evaluated = self.evaluate_population(population)
         rank, fronts = self.non_dominated_sorting(evaluated)
@@ -83,13 +83,8 @@ def main():
     # And update the label:
     plot_pareto_front(obj1_list, obj2_list, xlabel="Supply Satisfaction Rate (%)")
 
-def run_optimization(instance_idx=0):
-    import pandas as pd
-    import numpy as np
-    from problems.medical_supply_scheduling import MedicalSupplyScheduling
-    from algorithms.mowwo import MOWWO
-
-    df = pd.read_csv('src/data/sample_instance.csv')
+def load_instance(instance_idx=0, csv_path='src/data/sample_instance.csv'):
+    df = pd.read_csv(csv_path)
     row = df.iloc[instance_idx]
     data = {
         'm': int(row['m']),
@@ -122,18 +117,31 @@ def run_optimization(instance_idx=0):
         'C': float(row['C']),
         'S': float(row['S'])
     }
+    return data
+
+def run_optimization(instance_idx=0, initial_solutions=None, max_iterations=100, population_size=10, progress_callback=None, data=None):
+    # Use the given instance data (e.g. today's updated counts) or read it from the sample CSV
+    if data is None:
+        data = load_instance(instance_idx)
     problem = MedicalSupplyScheduling.from_dict(data)
     objectives = [problem.supply_satisfaction_rate, problem.scheduling_cost]
     constraints = []  # Add constraint functions if needed
-    population_size = 10
-    max_iterations = 100
-    mowwo = MOWWO(population_size, max_iterations, objectives, problem, constraints)
-    results = mowwo.run()
+    mowwo = MOWWO(population_size, max_iterations, objectives, problem, constraints,
+                  initial_solutions=initial_solutions)
+    results = mowwo.run(progress_callback=progress_callback)
     obj1_list, obj2_list = [], []
     for sol in results:
         obj1, obj2 = problem.evaluate(sol['xijk'], sol['xjjk'], sol['yo'], sol['ys'], sol['ym'], sol['yv'])
         obj1_list.append(obj1 * 100)  # percent
         obj2_list.append(obj2)
     return obj1_list, obj2_list, results
+
+def reoptimize(previous_results, instance_idx=0, max_iterations=20, population_size=10, data=None):
+    # Rolling re-planning: seed the population with a previous run's Pareto
+    # solutions (adapted to the updated instance) and run a short optimization
+    # instead of a full cold start
+    return run_optimization(instance_idx, initial_solutions=previous_results, max_iterations=max_iterations,
+                            population_size=population_size, data=data)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,305 @@
+"""
+Local job service for running MOWWO optimizations without blocking the caller.
+
+Runs a small asyncio HTTP server (standard library only) with a job queue, a
+bounded pool of worker processes, progress polling, cancellation and a result
+cache keyed by instance hash and run parameters.
+
+Start it from the project root:
+    python src/service.py --port 8765 --workers 2
+
+Endpoints:
+    POST   /jobs              submit {"instance_idx": 0, "population_size": 10, "max_iterations": 100}
+    GET    /jobs              list all jobs
+    GET    /jobs/<id>         job status and progress
+    GET    /jobs/<id>/result  Pareto front of a finished job
+    DELETE /jobs/<id>         cancel a queued or running job
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import uuid
+from collections import OrderedDict
+
+from main import load_instance, run_optimization
+
+DEFAULT_PARAMS = {'population_size': 10, 'max_iterations': 100}
+FINISHED = ('done', 'failed', 'cancelled')
+
+
+def to_serializable(obj):
+    if isinstance(obj, dict):
+        return {k: to_serializable(v) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [to_serializable(v) for v in obj]
+    elif hasattr(obj, "tolist"):
+        return obj.tolist()
+    else:
+        return obj
+
+
+def instance_hash(data):
+    # Hash the instance data itself, so edits to the CSV invalidate cached results
+    data = to_serializable(data)
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def cache_key(data, params):
+    return instance_hash(data) + ':' + json.dumps(params, sort_keys=True)
+
+
+def optimization_worker(conn, data, params):
+    # Runs in a child process and reports back over a pipe
+    def progress(iteration, total):
+        conn.send(('progress', iteration, total))
+    try:
+        satisfaction, cost_obj, results = run_optimization(data=data, progress_callback=progress, **params)
+        conn.send(('result', to_serializable({
+            'satisfaction': satisfaction,
+            'cost_obj': cost_obj,
+            'solutions': results,
+        })))
+    except Exception as e:
+        conn.send(('error', repr(e)))
+    finally:
+        conn.close()
+
+
+class JobService:
+    # Each submission is a job with its own id. Jobs with the same cache key
+    # share one run (the actual computation), which is only terminated once
+    # every job attached to it has been cancelled.
+    def __init__(self, workers=2, poll_interval=0.05, max_cache_entries=32, max_finished_jobs=200):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.max_cache_entries = max_cache_entries
+        self.max_finished_jobs = max_finished_jobs
+        self.jobs = OrderedDict()
+        self.cache = OrderedDict()  # cache key -> result, least recently used first
+        self.runs = {}  # cache key -> queued/running run
+        self.queue = None
+        self.tasks = []
+
+    async def start(self):
+        self.queue = asyncio.Queue()
+        self.tasks = [asyncio.create_task(self.worker_loop()) for _ in range(self.workers)]
+
+    async def stop(self):
+        for run in list(self.runs.values()):
+            self.cancel_run(run)
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    def submit(self, instance_idx=0, **params):
+        unknown = set(params) - set(DEFAULT_PARAMS)
+        if unknown:
+            raise ValueError(f"unknown parameters: {', '.join(sorted(unknown))}")
+        if int(instance_idx) < 0:
+            raise ValueError("instance_idx must be non-negative")
+        params = {k: int(params.get(k, v)) for k, v in DEFAULT_PARAMS.items()}
+        if params['population_size'] < 1 or params['max_iterations'] < 1:
+            raise ValueError("population_size and max_iterations must be positive")
+        # Load the instance once, so the worker optimizes exactly the data that was hashed
+        data = load_instance(int(instance_idx))
+        key = cache_key(data, params)
+        job = {
+            'id': uuid.uuid4().hex,
+            'instance_idx': int(instance_idx),
+            'params': params,
+            'status': 'queued',
+            'progress': 0.0,
+            'cached': False,
+            'error': None,
+            'result': None,
+            'run': None,
+        }
+        self.jobs[job['id']] = job
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            job.update(status='done', progress=1.0, cached=True, result=self.cache[key])
+            self.prune_jobs()
+            return job
+        # Identical run already queued or running: share it instead of duplicating work
+        run = self.runs.get(key)
+        if run is None:
+            run = {'key': key, 'data': data, 'params': params, 'status': 'queued',
+                   'progress': 0.0, 'process': None, 'jobs': set()}
+            self.runs[key] = run
+            self.queue.put_nowait(run)
+        run['jobs'].add(job['id'])
+        job['run'] = run
+        return job
+
+    def cancel(self, job_id):
+        job = self.jobs[job_id]
+        if job['status'] in FINISHED:
+            return job
+        run = job['run']
+        run['jobs'].discard(job_id)
+        job.update(status='cancelled', progress=run['progress'], run=None)
+        if not run['jobs']:
+            self.cancel_run(run)
+        self.prune_jobs()
+        return job
+
+    def cancel_run(self, run):
+        if run['process'] is not None:
+            run['process'].terminate()
+        self.finish(run, 'cancelled')
+
+    def finish(self, run, status, result=None, error=None):
+        run['status'] = status
+        self.runs.pop(run['key'], None)
+        if status == 'done':
+            self.cache[run['key']] = result
+            while len(self.cache) > self.max_cache_entries:
+                self.cache.popitem(last=False)
+        for job_id in run['jobs']:
+            job = self.jobs[job_id]
+            job.update(status=status, result=result, error=error, run=None)
+            if status == 'done':
+                job['progress'] = 1.0
+        run['jobs'].clear()
+        self.prune_jobs()
+
+    def prune_jobs(self):
+        # Forget the oldest finished jobs once there are too many
+        finished = [job_id for job_id, job in self.jobs.items() if job['status'] in FINISHED]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self.jobs[job_id]
+
+    async def worker_loop(self):
+        while True:
+            run = await self.queue.get()
+            try:
+                if run['status'] == 'queued':
+                    await self.execute(run)
+            except Exception as e:
+                # Keep this worker alive and release the run so later submits do not attach to it
+                if run['process'] is not None:
+                    run['process'].terminate()
+                if run['status'] not in FINISHED:
+                    self.finish(run, 'failed', error=repr(e))
+            finally:
+                self.queue.task_done()
+
+    async def execute(self, run):
+        parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+        try:
+            process = multiprocessing.Process(
+                target=optimization_worker, args=(child_conn, run['data'], run['params']), daemon=True)
+            process.start()
+        except Exception:
+            parent_conn.close()
+            child_conn.close()
+            raise
+        child_conn.close()
+        run.update(status='running', process=process)
+        try:
+            while run['status'] == 'running':
+                if parent_conn.poll():
+                    try:
+                        message = parent_conn.recv()
+                    except EOFError:
+                        self.finish(run, 'failed', error="worker exited unexpectedly")
+                        break
+                    if message[0] == 'progress':
+                        run['progress'] = message[1] / message[2]
+                    elif message[0] == 'result':
+                        self.finish(run, 'done', result=message[1])
+                    else:
+                        self.finish(run, 'failed', error=message[1])
+                elif not process.is_alive() and not parent_conn.poll():
+                    self.finish(run, 'failed', error="worker exited unexpectedly")
+                else:
+                    await asyncio.sleep(self.poll_interval)
+        finally:
+            parent_conn.close()
+            await asyncio.get_running_loop().run_in_executor(None, process.join)
+            run['process'] = None
+
+    def describe(self, job):
+        info = {k: v for k, v in job.items() if k not in ('result', 'run')}
+        if job['run'] is not None:
+            info.update(status=job['run']['status'], progress=job['run']['progress'])
+        return info
+
+
+async def handle_request(service, reader, writer):
+    status, payload = 400, {'error': 'bad request'}
+    try:
+        request_line = (await reader.readline()).decode().split()
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode().strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        body = await reader.readexactly(int(headers.get('content-length', 0)))
+        if len(request_line) >= 2:
+            status, payload = route(service, request_line[0], request_line[1], body)
+    except (ValueError, TypeError, IndexError, asyncio.IncompleteReadError) as e:
+        status, payload = 400, {'error': str(e)}
+    except Exception as e:
+        # e.g. the instance CSV is missing or malformed; still answer the client
+        status, payload = 500, {'error': repr(e)}
+    try:
+        data = json.dumps(payload).encode()
+        reasons = {200: 'OK', 202: 'Accepted', 400: 'Bad Request', 404: 'Not Found', 409: 'Conflict',
+                   500: 'Internal Server Error'}
+        writer.write(
+            f"HTTP/1.1 {status} {reasons[status]}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode()
+            + data)
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+def route(service, method, path, body):
+    parts = [p for p in path.split('?')[0].split('/') if p]
+    if parts == ['jobs']:
+        if method == 'POST':
+            job = service.submit(**(json.loads(body) if body else {}))
+            return 202, service.describe(job)
+        if method == 'GET':
+            return 200, [service.describe(job) for job in service.jobs.values()]
+    elif len(parts) in (2, 3) and parts[0] == 'jobs':
+        job = service.jobs.get(parts[1])
+        if job is None:
+            return 404, {'error': 'unknown job'}
+        if len(parts) == 3 and parts[2] == 'result' and method == 'GET':
+            if job['status'] != 'done':
+                return 409, {'error': f"job is {job['status']}"}
+            return 200, job['result']
+        if len(parts) == 2 and method == 'GET':
+            return 200, service.describe(job)
+        if len(parts) == 2 and method == 'DELETE':
+            return 200, service.describe(service.cancel(job['id']))
+    return 404, {'error': 'not found'}
+
+
+async def serve(host='127.0.0.1', port=8765, workers=2, cache_size=32):
+    service = JobService(workers, max_cache_entries=cache_size)
+    await service.start()
+    server = await asyncio.start_server(lambda r, w: handle_request(service, r, w), host, port)
+    print(f"MOWWO job service listening on http://{host}:{port} with {workers} workers")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local MOWWO optimization job service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--cache-size', type=int, default=32, help="number of results kept in the cache")
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, args.workers, args.cache_size))
@@ -5,23 +5,25 @@ import networkx as nx
 import sys
 import os
 import json
+import time
+import urllib.error
+import urllib.request
+import numpy as np
 
 st.set_page_config(page_title="Medical Supply Scheduling Optimization", layout="centered")
 
-def to_serializable(obj):
-    if isinstance(obj, dict):
-        return {k: to_serializable(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [to_serializable(v) for v in obj]
-    elif hasattr(obj, "tolist"):
-        return obj.tolist()
-    else:
-        return obj
-
 # Ensure src is in the path for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from main import run_optimization  # Make sure main.py has run_optimization()
+from service import to_serializable
+
+def service_request(url, method="GET", payload=None):
+    # Talk to the local job service (src/service.py) and return its JSON reply
+    data = json.dumps(payload).encode() if payload is not None else None
+    request = urllib.request.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.loads(response.read())
 
 # Sidebar with help
 st.sidebar.title("About")
@@ -38,12 +40,60 @@ This app demonstrates the results of the Multi-Objective Water Wave Optimization
 # Optionally, let user pick an instance
 instance_idx = st.number_input("Instance index (0 for first):", min_value=0, value=0, step=1)
 
+# Optionally submit runs to the local job service instead of blocking this app
+use_service = st.sidebar.checkbox("Run via local job service", value=False)
+service_url = st.sidebar.text_input("Job service URL", value="http://127.0.0.1:8765").rstrip("/")
+
 if st.button("Run Optimization"):
-    with st.spinner("Running optimization..."):
-        satisfaction, cost_obj, results = run_optimization(instance_idx)
-        st.session_state['satisfaction'] = satisfaction
-        st.session_state['cost_obj'] = cost_obj
-        st.session_state['results'] = results
+    if use_service:
+        try:
+            job = service_request(f"{service_url}/jobs", "POST", {"instance_idx": int(instance_idx)})
+            st.session_state['job_id'] = job['id']
+        except (urllib.error.URLError, OSError) as e:
+            st.error(f"Could not reach the job service at {service_url}: {e}")
+    else:
+        with st.spinner("Running optimization..."):
+            satisfaction, cost_obj, results = run_optimization(instance_idx)
+            st.session_state['satisfaction'] = satisfaction
+            st.session_state['cost_obj'] = cost_obj
+            st.session_state['results'] = results
+
+if 'service_error' in st.session_state:
+    st.error(st.session_state.pop('service_error'))
+
+# Poll a submitted job until it finishes
+if 'job_id' in st.session_state:
+    job_url = f"{service_url}/jobs/{st.session_state['job_id']}"
+    try:
+        job = service_request(job_url)
+    except (urllib.error.URLError, OSError) as e:
+        st.error(f"Lost contact with the job service: {e}")
+        del st.session_state['job_id']
+        job = None
+    if job is not None and job['status'] == 'done':
+        try:
+            result = service_request(f"{job_url}/result")
+            st.session_state['satisfaction'] = result['satisfaction']
+            st.session_state['cost_obj'] = result['cost_obj']
+            st.session_state['results'] = [{k: np.array(v) for k, v in sol.items()} for sol in result['solutions']]
+        except (urllib.error.URLError, OSError) as e:
+            st.error(f"Could not fetch the job result: {e}")
+        del st.session_state['job_id']
+    elif job is not None and job['status'] in ('failed', 'cancelled'):
+        st.error(f"Optimization job {job['status']}: {job['error'] or ''}")
+        del st.session_state['job_id']
+    elif job is not None:
+        st.progress(job['progress'], text=f"Optimization job {job['status']}...")
+        if st.button("Cancel job"):
+            try:
+                service_request(job_url, "DELETE")
+            except (urllib.error.URLError, OSError) as e:
+                # Shown after the rerun below
+                st.session_state['service_error'] = f"Could not cancel the job: {e}"
+            del st.session_state['job_id']
+            st.rerun()
+        time.sleep(1)
+        st.rerun()
 
 # Use session state for all downstream widgets
 if 'results' in st.session_state:
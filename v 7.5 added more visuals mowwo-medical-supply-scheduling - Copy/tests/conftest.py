@@ -0,0 +1,13 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+
+@pytest.fixture(autouse=True)
+def project_root(monkeypatch):
+    # load_instance reads src/data/sample_instance.csv relative to the project root
+    monkeypatch.chdir(ROOT)
@@ -0,0 +1,69 @@
+import random
+
+import numpy as np
+
+from algorithms.mowwo import MOWWO
+from main import load_instance, reoptimize, run_optimization
+from problems.medical_supply_scheduling import MedicalSupplyScheduling
+
+
+def make_mowwo(data, initial_solutions=None, population_size=10, max_iterations=5):
+    problem = MedicalSupplyScheduling.from_dict(data)
+    return MOWWO(population_size, max_iterations, [], problem, [], initial_solutions=initial_solutions)
+
+
+def evaluate(problem, sol):
+    return problem.evaluate(sol['xijk'], sol['xjjk'], sol['yo'], sol['ys'], sol['ym'], sol['yv'])
+
+
+def test_adapt_solution_resizes_to_new_dimensions():
+    # Instance 1 has m=3 civilian services, instance 0 has m=2
+    big = make_mowwo(load_instance(1)).random_solution()
+    mowwo = make_mowwo(load_instance(0))
+    adapted = mowwo.adapt_solution(big)
+    assert {k: v.shape for k, v in adapted.items()} == mowwo.solution_shapes()
+    # Shrinking keeps the overlapping entries (up to transfer capping)
+    np.testing.assert_array_equal(adapted['xijk'], big['xijk'][:2])
+    # Growing fills the new entries with zeros
+    grown = make_mowwo(load_instance(1)).adapt_solution(adapted)
+    assert grown['xijk'][2].sum() == 0 and grown['yo'][2].sum() == 0
+
+
+def test_adapt_solution_caps_transfers_and_drops_negatives():
+    data = load_instance(0)
+    data['no_i'], data['nv_i'] = [1, 0], [0, 2]
+    mowwo = make_mowwo(data)
+    sol = mowwo.random_solution()
+    sol['yo'] = np.array([[3, 2], [1, 1]])
+    sol['yv'] = np.array([[-1, 0], [2, 2]])
+    adapted = mowwo.adapt_solution(sol)
+    assert adapted['yo'].sum(axis=1).tolist() == [1, 0]
+    assert adapted['yv'].min() >= 0
+    assert adapted['yv'].sum(axis=1).tolist() == [0, 2]
+
+
+def test_warm_start_population_respects_caps():
+    data = load_instance(0)
+    data['no_i'], data['ns_i'] = [1, 1], [0, 0]
+    seed = make_mowwo(data).random_solution()
+    seed['yo'], seed['ys'] = np.eye(2, dtype=int), np.zeros((2, 2), dtype=int)
+    for _ in range(20):
+        # The perturbed seeds filling the population must stay within the caps too
+        for sol in make_mowwo(data, initial_solutions=[seed], population_size=20).population:
+            assert (sol['yo'].sum(axis=1) <= 1).all()
+            assert sol['ys'].sum() == 0
+
+
+def test_reoptimize_keeps_previous_front():
+    np.random.seed(0)
+    random.seed(0)
+    data = load_instance(1)
+    problem = MedicalSupplyScheduling.from_dict(data)
+    _, _, previous = run_optimization(data=data, max_iterations=30)
+    seeds = [make_mowwo(data).adapt_solution(sol) for sol in previous]
+    _, _, results = reoptimize(previous, data=data)
+    front = [evaluate(problem, sol) for sol in results]
+    # Every seed point is still on, or dominated by, the new front
+    for sol in seeds:
+        point = evaluate(problem, sol)
+        assert any(all(a >= b for a, b in zip(f, point)) for f in front)
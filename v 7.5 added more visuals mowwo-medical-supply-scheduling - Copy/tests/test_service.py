@@ -0,0 +1,151 @@
+import asyncio
+import json
+import multiprocessing
+
+import pytest
+
+import service
+from service import FINISHED, JobService, handle_request
+
+
+def queued_service(**kwargs):
+    # A service without worker tasks: submitted runs stay queued
+    svc = JobService(**kwargs)
+    svc.queue = asyncio.Queue()
+    return svc
+
+
+async def wait_finished(job, timeout=30):
+    for _ in range(int(timeout / 0.05)):
+        if job['status'] in FINISHED:
+            return
+        await asyncio.sleep(0.05)
+    raise AssertionError(f"job still {job['status']}")
+
+
+def test_identical_submissions_share_one_run():
+    svc = queued_service()
+    a = svc.submit(0, max_iterations=5)
+    b = svc.submit(0, max_iterations=5)
+    c = svc.submit(0, max_iterations=6)
+    assert a['id'] != b['id']
+    assert a['run'] is b['run'] and c['run'] is not a['run']
+    assert svc.queue.qsize() == 2
+
+
+def test_shared_run_cancelled_only_by_last_job():
+    svc = queued_service()
+    a = svc.submit(0, max_iterations=5)
+    b = svc.submit(0, max_iterations=5)
+    run = a['run']
+    svc.cancel(a['id'])
+    assert a['status'] == 'cancelled'
+    assert svc.describe(b)['status'] == 'queued' and run['status'] == 'queued'
+    svc.cancel(b['id'])
+    assert b['status'] == 'cancelled' and run['status'] == 'cancelled'
+    assert not svc.runs
+
+
+def test_shared_running_run_survives_partial_cancel():
+    async def scenario():
+        svc = JobService(workers=1)
+        await svc.start()
+        try:
+            a = svc.submit(1, max_iterations=100000)
+            b = svc.submit(1, max_iterations=100000)
+            run = a['run']
+            while run['process'] is None:
+                await asyncio.sleep(0.05)
+            process = run['process']
+            svc.cancel(a['id'])
+            await asyncio.sleep(0.2)
+            assert process.is_alive() and svc.describe(b)['status'] == 'running'
+            svc.cancel(b['id'])
+            await asyncio.sleep(0.5)
+            assert not process.is_alive() and run['status'] == 'cancelled'
+        finally:
+            await svc.stop()
+    asyncio.run(scenario())
+
+
+def test_cache_evicts_least_recently_used():
+    svc = queued_service(max_cache_entries=2)
+    jobs = [svc.submit(0, max_iterations=i) for i in (1, 2)]
+    for job in jobs:
+        svc.finish(job['run'], 'done', result={'iterations': job['params']['max_iterations']})
+    # Touch the first result so the second becomes least recently used
+    hit = svc.submit(0, max_iterations=1)
+    assert hit['cached'] and hit['result'] == {'iterations': 1}
+    third = svc.submit(0, max_iterations=3)
+    svc.finish(third['run'], 'done', result={'iterations': 3})
+    assert len(svc.cache) == 2
+    assert svc.submit(0, max_iterations=1)['cached']
+    assert not svc.submit(0, max_iterations=2)['cached']
+
+
+def test_finished_jobs_are_pruned():
+    svc = queued_service(max_finished_jobs=2)
+    jobs = [svc.submit(0, max_iterations=i) for i in (1, 2, 3)]
+    pending = svc.submit(0, max_iterations=4)
+    for job in jobs:
+        svc.cancel(job['id'])
+    assert list(svc.jobs) == [jobs[1]['id'], jobs[2]['id'], pending['id']]
+
+
+@pytest.mark.parametrize('body', [
+    {'instance_idx': -1},
+    {'bogus': 1},
+    {'max_iteration': 5},
+    {'population_size': 0},
+])
+def test_submit_rejects_invalid_requests(body):
+    with pytest.raises(ValueError):
+        queued_service().submit(**body)
+
+
+def test_worker_failure_releases_run(monkeypatch):
+    def fail(self):
+        raise OSError("too many open files")
+
+    async def scenario():
+        svc = JobService(workers=1)
+        await svc.start()
+        try:
+            monkeypatch.setattr(multiprocessing.Process, 'start', fail)
+            job = svc.submit(0, max_iterations=5)
+            await wait_finished(job)
+            assert job['status'] == 'failed' and 'too many open files' in job['error']
+            assert not svc.runs
+            monkeypatch.undo()
+            # The worker task is still alive and a new identical submit runs again
+            retry = svc.submit(0, max_iterations=5)
+            assert retry['run'] is not None
+            await wait_finished(retry)
+            assert retry['status'] == 'done'
+        finally:
+            await svc.stop()
+    asyncio.run(scenario())
+
+
+def test_unexpected_error_returns_json_500(monkeypatch):
+    def missing(instance_idx):
+        raise FileNotFoundError("sample_instance.csv")
+    monkeypatch.setattr(service, 'load_instance', missing)
+
+    async def scenario():
+        svc = queued_service()
+        server = await asyncio.start_server(lambda r, w: handle_request(svc, r, w), '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            body = json.dumps({'instance_idx': 0}).encode()
+            writer.write(b"POST /jobs HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+        return response
+
+    response = asyncio.run(scenario())
+    head, _, payload = response.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 500")
+    assert 'FileNotFoundError' in json.loads(payload)['error']